@@ -2,6 +2,7 @@
 
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
+use std::fmt::Write;
 use std::path::Path;
 
 use crate::error::{IndustryDbError, Result};
@@ -43,6 +44,9 @@ impl std::str::FromStr for DatabaseType {
     }
 }
 
+/// Function that builds the connection URI for one database type
+pub type UriBuilder = fn(&ConnectionConfig) -> Result<String>;
+
 /// Connection configuration for a single database
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct ConnectionConfig {
@@ -151,64 +155,93 @@ impl ConnectionConfig {
 
     /// Build a connection URI string
     pub fn to_uri(&self) -> Result<String> {
-        match self.db_type {
-            DatabaseType::Postgres => {
-                let host = self
-                    .host
-                    .as_ref()
-                    .ok_or_else(|| IndustryDbError::config_error("Missing host for Postgres"))?;
-                let port = self.port.unwrap_or(5432);
-                let database = self.database.as_ref().ok_or_else(|| {
-                    IndustryDbError::config_error("Missing database for Postgres")
-                })?;
-                let username = self.username.as_ref().ok_or_else(|| {
-                    IndustryDbError::config_error("Missing username for Postgres")
-                })?;
-                let password = self.password.as_ref().ok_or_else(|| {
-                    IndustryDbError::config_error("Missing password for Postgres")
-                })?;
-
-                Ok(format!(
-                    "postgresql://{}:{}@{}:{}/{}",
-                    username, password, host, port, database
-                ))
-            }
-            DatabaseType::Sqlite => {
-                let path = self
-                    .path
-                    .as_ref()
-                    .ok_or_else(|| IndustryDbError::config_error("Missing path for SQLite"))?;
-                Ok(format!("sqlite://{}", path))
-            }
-            DatabaseType::Mssql => {
-                let server = self
-                    .server
-                    .as_ref()
-                    .or(self.host.as_ref())
-                    .ok_or_else(|| IndustryDbError::config_error("Missing server for MSSQL"))?;
-                let database = self
-                    .database
-                    .as_ref()
-                    .ok_or_else(|| IndustryDbError::config_error("Missing database for MSSQL"))?;
-
-                if self.trusted_connection.unwrap_or(false) {
-                    Ok(format!(
-                        "mssql://{}/?database={}&trusted_connection=true",
-                        server, database
-                    ))
-                } else {
-                    let username = self.username.as_ref().ok_or_else(|| {
-                        IndustryDbError::config_error("Missing username for MSSQL")
-                    })?;
-                    let password = self.password.as_ref().ok_or_else(|| {
-                        IndustryDbError::config_error("Missing password for MSSQL")
-                    })?;
-                    Ok(format!(
-                        "mssql://{}:{}@{}/?database={}",
-                        username, password, server, database
-                    ))
-                }
-            }
+        (Self::uri_builder(self.db_type))(self)
+    }
+
+    /// Select the URI builder for a database type
+    ///
+    /// The shape of a URI only depends on the database type, so callers that
+    /// format the same configuration repeatedly can resolve the builder once.
+    pub fn uri_builder(db_type: DatabaseType) -> UriBuilder {
+        match db_type {
+            DatabaseType::Postgres => Self::postgres_uri,
+            DatabaseType::Sqlite => Self::sqlite_uri,
+            DatabaseType::Mssql => Self::mssql_uri,
+        }
+    }
+
+    fn postgres_uri(&self) -> Result<String> {
+        let host = self
+            .host
+            .as_ref()
+            .ok_or_else(|| IndustryDbError::config_error("Missing host for Postgres"))?;
+        let port = self.port.unwrap_or(5432);
+        let database = self
+            .database
+            .as_ref()
+            .ok_or_else(|| IndustryDbError::config_error("Missing database for Postgres"))?;
+        let username = self
+            .username
+            .as_ref()
+            .ok_or_else(|| IndustryDbError::config_error("Missing username for Postgres"))?;
+        let password = self
+            .password
+            .as_ref()
+            .ok_or_else(|| IndustryDbError::config_error("Missing password for Postgres"))?;
+
+        // "postgresql://" + separators + up to 5 port digits
+        let mut uri = String::with_capacity(
+            24 + username.len() + password.len() + host.len() + database.len(),
+        );
+        let _ = write!(
+            uri,
+            "postgresql://{}:{}@{}:{}/{}",
+            username, password, host, port, database
+        );
+        Ok(uri)
+    }
+
+    fn sqlite_uri(&self) -> Result<String> {
+        let path = self
+            .path
+            .as_ref()
+            .ok_or_else(|| IndustryDbError::config_error("Missing path for SQLite"))?;
+
+        let mut uri = String::with_capacity("sqlite://".len() + path.len());
+        uri.push_str("sqlite://");
+        uri.push_str(path);
+        Ok(uri)
+    }
+
+    fn mssql_uri(&self) -> Result<String> {
+        let server = self
+            .server
+            .as_ref()
+            .or(self.host.as_ref())
+            .ok_or_else(|| IndustryDbError::config_error("Missing server for MSSQL"))?;
+        let database = self
+            .database
+            .as_ref()
+            .ok_or_else(|| IndustryDbError::config_error("Missing database for MSSQL"))?;
+
+        if self.trusted_connection.unwrap_or(false) {
+            Ok(format!(
+                "mssql://{}/?database={}&trusted_connection=true",
+                server, database
+            ))
+        } else {
+            let username = self
+                .username
+                .as_ref()
+                .ok_or_else(|| IndustryDbError::config_error("Missing username for MSSQL"))?;
+            let password = self
+                .password
+                .as_ref()
+                .ok_or_else(|| IndustryDbError::config_error("Missing password for MSSQL"))?;
+            Ok(format!(
+                "mssql://{}:{}@{}/?database={}",
+                username, password, server, database
+            ))
         }
     }
 
@@ -368,4 +401,12 @@ mod tests {
         assert!(uri.starts_with("postgresql://"));
         assert!(uri.contains("user:secret@localhost:5432/mydb"));
     }
+
+    #[test]
+    fn test_uri_builder_matches_to_uri() {
+        let config = ConnectionConfig::sqlite("./test.db");
+        let build = ConnectionConfig::uri_builder(config.db_type);
+        assert_eq!(build(&config).unwrap(), "sqlite://./test.db");
+        assert_eq!(build(&config).unwrap(), config.to_uri().unwrap());
+    }
 }
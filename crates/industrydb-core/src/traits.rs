@@ -15,6 +15,11 @@ pub trait DatabaseConnector: Send + Sync {
     /// Execute a raw SQL query and return a DataFrame
     async fn execute(&self, sql: &str) -> Result<DataFrame>;
 
+    /// Execute a script of one or more SQL statements in a single round-trip
+    ///
+    /// Result sets produced by the script are discarded.
+    async fn execute_batch(&self, sql: &str) -> Result<()>;
+
     /// Check if the connection is alive
     async fn is_alive(&self) -> bool;
 
@@ -82,6 +82,26 @@ impl DatabaseConnector for MssqlConnector {
         rows_to_dataframe(&rows[0])
     }
 
+    async fn execute_batch(&self, sql: &str) -> Result<()> {
+        let mut conn = self
+            .pool
+            .get()
+            .await
+            .map_err(|e| IndustryDbError::ConnectionError(e.to_string()))?;
+
+        // GO is a client-side batch separator, so each section is sent as its own batch
+        for batch in split_batches(sql) {
+            conn.simple_query(batch)
+                .await
+                .map_err(|e| IndustryDbError::QueryError(e.to_string()))?
+                .into_results()
+                .await
+                .map_err(|e| IndustryDbError::QueryError(e.to_string()))?;
+        }
+
+        Ok(())
+    }
+
     async fn is_alive(&self) -> bool {
         if let Ok(mut conn) = self.pool.get().await {
             conn.query("SELECT 1", &[]).await.is_ok()
@@ -101,6 +121,31 @@ impl DatabaseConnector for MssqlConnector {
     }
 }
 
+/// Split a T-SQL script into batches on lines consisting only of `GO`
+fn split_batches(sql: &str) -> Vec<String> {
+    let mut batches = Vec::new();
+    let mut current = String::new();
+
+    for line in sql.lines() {
+        if line.trim().eq_ignore_ascii_case("go") {
+            if !current.trim().is_empty() {
+                batches.push(std::mem::take(&mut current));
+            } else {
+                current.clear();
+            }
+        } else {
+            current.push_str(line);
+            current.push('\n');
+        }
+    }
+
+    if !current.trim().is_empty() {
+        batches.push(current);
+    }
+
+    batches
+}
+
 /// Convert tiberius rows to Polars DataFrame
 fn rows_to_dataframe(rows: &[TiberiusRow]) -> Result<DataFrame> {
     if rows.is_empty() {
@@ -163,3 +208,17 @@ fn rows_to_dataframe(rows: &[TiberiusRow]) -> Result<DataFrame> {
     let columns: Vec<_> = series_vec.into_iter().map(|s| s.into_column()).collect();
     DataFrame::new(columns).map_err(|e| IndustryDbError::PolarsError(e.to_string()))
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_split_batches() {
+        let script = "CREATE TABLE t (id INT)\nGO\n  go  \nINSERT INTO t VALUES (1)\nSELECT 1";
+        let batches = split_batches(script);
+        assert_eq!(batches.len(), 2);
+        assert_eq!(batches[0], "CREATE TABLE t (id INT)\n");
+        assert_eq!(batches[1], "INSERT INTO t VALUES (1)\nSELECT 1\n");
+    }
+}
@@ -7,7 +7,17 @@ use industrydb_core::{
     traits::DatabaseConnector,
 };
 use polars::prelude::*;
-use sqlx::{postgres::PgRow, Column as SqlxColumn, PgPool, Row, TypeInfo};
+use sqlx::{
+    postgres::{PgConnectOptions, PgRow},
+    Column as SqlxColumn, PgPool, Row, TypeInfo,
+};
+use std::str::FromStr;
+
+/// Prepared statements kept per pooled connection, keyed by SQL text.
+///
+/// `sqlx::query` marks statements as persistent, so repeated executions of the
+/// same SQL reuse the server-side prepared statement instead of re-parsing it.
+const STATEMENT_CACHE_CAPACITY: usize = 128;
 
 /// PostgreSQL database connector with connection pool
 pub struct PostgresConnector {
@@ -27,7 +37,11 @@ impl PostgresConnector {
             config.database.as_deref().unwrap_or("postgres")
         );
 
-        let pool = PgPool::connect(&database_url)
+        let options = PgConnectOptions::from_str(&database_url)
+            .map_err(|e| IndustryDbError::ConnectionError(e.to_string()))?
+            .statement_cache_capacity(STATEMENT_CACHE_CAPACITY);
+
+        let pool = PgPool::connect_with(options)
             .await
             .map_err(|e| IndustryDbError::ConnectionError(e.to_string()))?;
 
@@ -64,6 +78,16 @@ impl DatabaseConnector for PostgresConnector {
         rows_to_dataframe(rows)
     }
 
+    async fn execute_batch(&self, sql: &str) -> Result<()> {
+        // raw_sql uses the simple query protocol, which accepts multiple statements
+        sqlx::raw_sql(sql)
+            .execute(&self.pool)
+            .await
+            .map_err(|e| IndustryDbError::QueryError(e.to_string()))?;
+
+        Ok(())
+    }
+
     async fn is_alive(&self) -> bool {
         sqlx::query("SELECT 1").fetch_one(&self.pool).await.is_ok()
     }
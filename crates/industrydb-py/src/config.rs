@@ -5,13 +5,15 @@ use pyo3::types::PyDict;
 use std::collections::HashMap;
 
 use crate::errors::{to_py_err, to_py_result};
-use industrydb_core::config::{ConnectionConfig as CoreConnectionConfig, DatabaseType};
+use industrydb_core::config::{ConnectionConfig as CoreConnectionConfig, DatabaseType, UriBuilder};
 
 /// Python-exposed database configuration
 #[pyclass(name = "PyDatabaseConfig")]
 #[derive(Clone)]
 pub struct PyDatabaseConfig {
     inner: CoreConnectionConfig,
+    /// URI builder resolved once from the database type at construction
+    uri_fn: UriBuilder,
 }
 
 #[pymethods]
@@ -63,7 +65,7 @@ impl PyDatabaseConfig {
 
         config.validate().map_err(to_py_err)?;
 
-        Ok(PyDatabaseConfig { inner: config })
+        Ok(Self::from_inner(config))
     }
 
     /// Create from dictionary
@@ -99,7 +101,7 @@ impl PyDatabaseConfig {
     #[staticmethod]
     fn from_uri(uri: String) -> PyResult<Self> {
         let config = CoreConnectionConfig::from_uri(&uri).map_err(to_py_err)?;
-        Ok(PyDatabaseConfig { inner: config })
+        Ok(Self::from_inner(config))
     }
 
     /// Convert to dictionary
@@ -135,7 +137,7 @@ impl PyDatabaseConfig {
 
     /// Convert to URI string
     fn to_uri(&self) -> PyResult<String> {
-        to_py_result(self.inner.to_uri())
+        to_py_result((self.uri_fn)(&self.inner))
     }
 
     /// Get database type
@@ -154,6 +156,14 @@ impl PyDatabaseConfig {
 }
 
 impl PyDatabaseConfig {
+    /// Wrap a core config, resolving its URI builder up front
+    fn from_inner(inner: CoreConnectionConfig) -> Self {
+        Self {
+            uri_fn: CoreConnectionConfig::uri_builder(inner.db_type),
+            inner,
+        }
+    }
+
     /// Get reference to inner config
     pub fn inner(&self) -> &CoreConnectionConfig {
         &self.inner
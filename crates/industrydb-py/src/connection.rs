@@ -89,7 +89,7 @@ impl PyConnection {
         py: Python,
         sql: String,
         params: Option<&Bound<'_, PyList>>,
-    ) -> PyResult<Py<PyDict>> {
+    ) -> PyResult<PyObject> {
         let conn = self.inner.as_ref().ok_or_else(|| {
             PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Connection is closed")
         })?;
@@ -97,11 +97,22 @@ impl PyConnection {
         // TODO: Implement parameter binding
         let _ = params;
 
-        let df = self
+        let mut df = self
             .runtime
             .block_on(conn.execute(&sql))
             .map_err(to_py_err)?;
-        dataframe_to_py_dict(py, &df)
+        dataframe_to_py_polars(py, &mut df)
+    }
+
+    /// Execute a script of one or more SQL statements in a single round-trip
+    fn execute_batch(&self, sql: String) -> PyResult<()> {
+        let conn = self.inner.as_ref().ok_or_else(|| {
+            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Connection is closed")
+        })?;
+
+        self.runtime
+            .block_on(conn.execute_batch(&sql))
+            .map_err(to_py_err)
     }
 
     /// Insert data into table
@@ -109,14 +120,18 @@ impl PyConnection {
     fn insert(
         &self,
         table: String,
-        data: &Bound<'_, PyDict>,
+        data: &Bound<'_, PyAny>,
         _kwargs: Option<&Bound<'_, PyDict>>,
     ) -> PyResult<usize> {
         let conn = self.inner.as_ref().ok_or_else(|| {
             PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Connection is closed")
         })?;
 
-        let df = py_dict_to_dataframe(data)?;
+        let df = if let Ok(dict) = data.downcast::<PyDict>() {
+            py_dict_to_dataframe(dict)?
+        } else {
+            py_polars_to_dataframe(data)?
+        };
         let rows = self
             .runtime
             .block_on(conn.insert(&table, df))
@@ -136,19 +151,19 @@ impl PyConnection {
         params: Option<&Bound<'_, PyList>>,
         limit: Option<usize>,
         _kwargs: Option<&Bound<'_, PyDict>>,
-    ) -> PyResult<Py<PyDict>> {
+    ) -> PyResult<PyObject> {
         let conn = self.inner.as_ref().ok_or_else(|| {
             PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Connection is closed")
         })?;
 
         let _ = params;
 
-        let df = self
+        let mut df = self
             .runtime
             .block_on(conn.select(&table, columns.as_deref(), where_clause.as_deref(), limit))
             .map_err(to_py_err)?;
 
-        dataframe_to_py_dict(py, &df)
+        dataframe_to_py_polars(py, &mut df)
     }
 
     /// Update rows in table
@@ -206,6 +221,9 @@ impl PyConnection {
     }
 
     /// Context manager entry
+    ///
+    /// Returns the connection itself rather than a wrapper object, so `with`
+    /// costs no more than calling `connect()` and `close()` directly.
     fn __enter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
         slf
     }
@@ -260,86 +278,49 @@ async fn create_connector(
     }
 }
 
-/// Convert Polars DataFrame to Python dict
-fn dataframe_to_py_dict(py: Python, df: &polars::prelude::DataFrame) -> PyResult<Py<PyDict>> {
+/// Convert a Rust Polars DataFrame to a Python Polars DataFrame
+///
+/// The frame is written to a single Arrow IPC buffer and loaded with
+/// `polars.read_ipc`, so result cells are never boxed as individual Python objects.
+fn dataframe_to_py_polars(py: Python, df: &mut polars::prelude::DataFrame) -> PyResult<PyObject> {
     use polars::prelude::*;
+    use pyo3::types::PyBytes;
+
+    // Oldest compat level writes plain Utf8/Binary instead of string views, so any
+    // Python polars release allowed by pyproject.toml can read the buffer
+    let mut buffer = Vec::new();
+    IpcWriter::new(&mut buffer)
+        .with_compat_level(CompatLevel::oldest())
+        .finish(df)
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+
+    let polars = py.import_bound("polars")?;
+    let df = polars.call_method1("read_ipc", (PyBytes::new_bound(py, &buffer),))?;
+    Ok(df.unbind())
+}
 
-    let dict = PyDict::new_bound(py);
-
-    for col in df.get_columns() {
-        let col_name = col.name().as_str();
-        let values = PyList::empty_bound(py);
-
-        // Convert column to PyList based on dtype
-        for i in 0..col.len() {
-            if col.is_null().get(i).unwrap_or(false) {
-                values.append(py.None())?;
-            } else {
-                match col.dtype() {
-                    DataType::Int32 => {
-                        let val = col
-                            .i32()
-                            .map_err(|e| {
-                                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string())
-                            })?
-                            .get(i);
-                        values.append(val)?;
-                    }
-                    DataType::Int64 => {
-                        let val = col
-                            .i64()
-                            .map_err(|e| {
-                                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string())
-                            })?
-                            .get(i);
-                        values.append(val)?;
-                    }
-                    DataType::Float64 => {
-                        let val = col
-                            .f64()
-                            .map_err(|e| {
-                                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string())
-                            })?
-                            .get(i);
-                        values.append(val)?;
-                    }
-                    DataType::String => {
-                        let val = col
-                            .str()
-                            .map_err(|e| {
-                                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string())
-                            })?
-                            .get(i)
-                            .unwrap_or("");
-                        values.append(val)?;
-                    }
-                    DataType::Boolean => {
-                        let val = col
-                            .bool()
-                            .map_err(|e| {
-                                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string())
-                            })?
-                            .get(i);
-                        values.append(val)?;
-                    }
-                    _ => {
-                        // Fallback to string representation
-                        values.append(format!(
-                            "{:?}",
-                            col.get(i)
-                                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
-                                    e.to_string()
-                                ))?
-                        ))?;
-                    }
-                }
-            }
-        }
+/// Convert a Python Polars DataFrame to a Rust Polars DataFrame
+///
+/// The frame is serialized to Arrow IPC on the Python side and read back from
+/// that single buffer, so column data never goes through per-cell Python objects.
+fn py_polars_to_dataframe(data: &Bound<'_, PyAny>) -> PyResult<polars::prelude::DataFrame> {
+    use polars::prelude::*;
+    use pyo3::types::PyBytes;
 
-        dict.set_item(col_name, values)?;
+    if !data.hasattr("write_ipc")? {
+        return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+            "data must be a Polars DataFrame or a dict of lists",
+        ));
     }
 
-    Ok(dict.unbind())
+    let buffer = data
+        .call_method1("write_ipc", (data.py().None(),))?
+        .call_method0("getvalue")?;
+    let bytes = buffer.downcast::<PyBytes>()?;
+
+    IpcReader::new(std::io::Cursor::new(bytes.as_bytes()))
+        .finish()
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))
 }
 
 /// Convert Python dict to Polars DataFrame
@@ -7,7 +7,17 @@ use industrydb_core::{
     traits::DatabaseConnector,
 };
 use polars::prelude::*;
-use sqlx::{sqlite::SqliteRow, Column as SqlxColumn, Row, SqlitePool};
+use sqlx::{
+    sqlite::{SqliteConnectOptions, SqliteRow},
+    Column as SqlxColumn, Row, SqlitePool,
+};
+use std::str::FromStr;
+
+/// Prepared statements kept per pooled connection, keyed by SQL text.
+///
+/// `sqlx::query` marks statements as persistent, so repeated executions of the
+/// same SQL reuse the compiled statement instead of re-parsing it.
+const STATEMENT_CACHE_CAPACITY: usize = 128;
 
 /// SQLite database connector with connection pool
 pub struct SqliteConnector {
@@ -23,7 +33,11 @@ impl SqliteConnector {
             config.database.as_deref().unwrap_or(":memory:")
         );
 
-        let pool = SqlitePool::connect(&database_url)
+        let options = SqliteConnectOptions::from_str(&database_url)
+            .map_err(|e| IndustryDbError::ConnectionError(e.to_string()))?
+            .statement_cache_capacity(STATEMENT_CACHE_CAPACITY);
+
+        let pool = SqlitePool::connect_with(options)
             .await
             .map_err(|e| IndustryDbError::ConnectionError(e.to_string()))?;
 
@@ -58,6 +72,15 @@ impl DatabaseConnector for SqliteConnector {
         rows_to_dataframe(rows)
     }
 
+    async fn execute_batch(&self, sql: &str) -> Result<()> {
+        sqlx::raw_sql(sql)
+            .execute(&self.pool)
+            .await
+            .map_err(|e| IndustryDbError::QueryError(e.to_string()))?;
+
+        Ok(())
+    }
+
     async fn is_alive(&self) -> bool {
         sqlx::query("SELECT 1").fetch_one(&self.pool).await.is_ok()
     }
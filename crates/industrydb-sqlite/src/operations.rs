@@ -1,4 +1,4 @@
-//! CRUD operations for PostgreSQL
+//! CRUD operations for SQLite
 
 use crate::connector::SqliteConnector;
 use async_trait::async_trait;
@@ -7,8 +7,11 @@ use industrydb_core::{
     traits::{CrudOperations, DatabaseConnector},
 };
 use polars::prelude::*;
+use sqlx::{query::Query, sqlite::SqliteArguments, Sqlite};
 use std::collections::HashMap;
 
+type SqliteQuery<'q> = Query<'q, Sqlite, SqliteArguments<'q>>;
+
 #[async_trait]
 impl CrudOperations for SqliteConnector {
     async fn insert(&self, table: &str, data: DataFrame) -> Result<usize> {
@@ -21,38 +24,45 @@ impl CrudOperations for SqliteConnector {
             .iter()
             .map(|s| s.to_string())
             .collect();
+        let placeholders = vec!["?"; columns.len()].join(", ");
 
-        let mut rows_inserted = 0;
+        let sql = format!(
+            "INSERT INTO {} ({}) VALUES ({})",
+            table,
+            columns.join(", "),
+            placeholders
+        );
 
-        for row_idx in 0..data.height() {
-            let mut values = Vec::new();
+        let series: Vec<&Series> = data
+            .get_columns()
+            .iter()
+            .map(|c| c.as_materialized_series())
+            .collect();
 
-            for col_name in columns.iter() {
-                let column = data.column(col_name)?;
-                let series = column.as_materialized_series();
-                let value = format_value(series, row_idx)?;
-                values.push(value);
-            }
+        // One transaction for the whole frame instead of an implicit commit per row;
+        // the statement is prepared once and cached on the connection, then re-bound per row
+        let mut tx = self
+            .pool()
+            .begin()
+            .await
+            .map_err(|e| IndustryDbError::QueryError(e.to_string()))?;
 
-            let sql = format!(
-                "INSERT INTO {} ({}) VALUES ({})",
-                table,
-                columns.join(", "),
-                values.join(", ")
-            );
-
-            match self.execute(&sql).await {
-                Ok(_) => rows_inserted += 1,
-                Err(e) => {
-                    return Err(IndustryDbError::query_error(format!(
-                        "Insert failed at row {}: {}",
-                        row_idx, e
-                    )));
-                }
+        for row_idx in 0..data.height() {
+            let mut query = sqlx::query(&sql);
+            for s in series.iter() {
+                query = bind_value(query, s, row_idx)?;
             }
+
+            query.execute(&mut *tx).await.map_err(|e| {
+                IndustryDbError::query_error(format!("Insert failed at row {}: {}", row_idx, e))
+            })?;
         }
 
-        Ok(rows_inserted)
+        tx.commit()
+            .await
+            .map_err(|e| IndustryDbError::QueryError(e.to_string()))?;
+
+        Ok(data.height())
     }
 
     async fn select(
@@ -124,42 +134,30 @@ impl CrudOperations for SqliteConnector {
     }
 }
 
-fn format_value(series: &Series, idx: usize) -> Result<String> {
-    if series.is_null().get(idx).unwrap_or(false) {
-        return Ok("NULL".to_string());
-    }
-
-    match series.dtype() {
-        DataType::Int8
-        | DataType::Int16
-        | DataType::Int32
-        | DataType::Int64
-        | DataType::UInt8
-        | DataType::UInt16
-        | DataType::UInt32
-        | DataType::UInt64
-        | DataType::Float32
-        | DataType::Float64 => {
-            let val = series.get(idx).unwrap();
-            Ok(format!("{}", val))
-        }
-        DataType::String => {
-            let val = series.get(idx).unwrap();
-            let s = val.to_string().replace('\'', "''");
-            Ok(format!("'{}'", s))
-        }
-        DataType::Boolean => {
-            let val = series.get(idx).unwrap();
-            Ok(if val.to_string() == "true" {
-                "TRUE"
-            } else {
-                "FALSE"
-            }
-            .to_string())
-        }
-        _ => {
-            let val = series.get(idx).unwrap();
-            Ok(format!("'{}'", val.to_string().replace('\'', "''")))
-        }
-    }
+/// Bind a single DataFrame cell as a query parameter
+fn bind_value<'q>(query: SqliteQuery<'q>, series: &Series, idx: usize) -> Result<SqliteQuery<'q>> {
+    let value = series
+        .get(idx)
+        .map_err(|e| IndustryDbError::PolarsError(e.to_string()))?;
+
+    Ok(match value {
+        AnyValue::Null => query.bind(None::<i64>),
+        AnyValue::Boolean(v) => query.bind(v),
+        AnyValue::Int8(v) => query.bind(v as i64),
+        AnyValue::Int16(v) => query.bind(v as i64),
+        AnyValue::Int32(v) => query.bind(v as i64),
+        AnyValue::Int64(v) => query.bind(v),
+        AnyValue::UInt8(v) => query.bind(v as i64),
+        AnyValue::UInt16(v) => query.bind(v as i64),
+        AnyValue::UInt32(v) => query.bind(v as i64),
+        AnyValue::UInt64(v) => query.bind(i64::try_from(v).map_err(|_| {
+            IndustryDbError::invalid_parameter(format!("Value {} out of range for SQLite", v))
+        })?),
+        AnyValue::Float32(v) => query.bind(v as f64),
+        AnyValue::Float64(v) => query.bind(v),
+        AnyValue::String(v) => query.bind(v.to_string()),
+        AnyValue::StringOwned(v) => query.bind(v.to_string()),
+        // Other types are stored as their text representation
+        other => query.bind(other.to_string()),
+    })
 }
@@ -21,15 +21,16 @@ def main():
     with idb.Connection(config) as conn:
         print("   ✓ Connected!\n")
 
-        # Create a table
+        # Create a table (the whole setup script is sent in one round-trip)
         print("2. Creating table...")
-        conn.execute("""
+        conn.execute_batch("""
             CREATE TABLE IF NOT EXISTS employees (
                 id INTEGER PRIMARY KEY,
                 name TEXT NOT NULL,
                 department TEXT,
                 salary REAL
-            )
+            );
+            DELETE FROM employees;
         """)
         print("   ✓ Table created!\n")
 
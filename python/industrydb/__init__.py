@@ -6,7 +6,7 @@ with Polars DataFrame integration.
 """
 
 # Re-export main classes for convenience
-from .config import load_config
+from .config import ConfigSet, load_config
 from .industrydb import (
     ConfigurationError,
     DatabaseConnectionError,
@@ -17,6 +17,10 @@ from .industrydb import (
 )
 from .industrydb import PyConnection as Connection
 from .industrydb import PyDatabaseConfig as DatabaseConfig
+from .pooling import ConnectionPool, close_pools, pool
+
+# Plain open/close alternative to ``with Connection(config) as conn:``
+connect = Connection.connect
 
 __all__ = [
     "__version__",
@@ -24,8 +28,14 @@ __all__ = [
     # Config
     "DatabaseConfig",
     "load_config",
+    "ConfigSet",
     # Connection
     "Connection",
+    "connect",
+    # Pooling
+    "ConnectionPool",
+    "pool",
+    "close_pools",
     # Exceptions
     "IndustryDbError",
     "DatabaseConnectionError",
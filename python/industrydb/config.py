@@ -1,35 +1,107 @@
 """Configuration loading utilities for IndustryDB."""
 
+import keyword
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Callable, Iterator, Mapping, Union
 
-# TOML library compatibility layer
-# Try rtoml (fastest), then tomllib (Python 3.11+), then tomli (fallback)
-# Note: Different libraries have different signatures, use Any for compatibility
-_toml_load: Any
+from .industrydb import ConfigurationError
+from .industrydb import PyDatabaseConfig as DatabaseConfig
+
+
+class ConfigSet(Mapping[str, DatabaseConfig]):
+    """
+    Read-only mapping of connection names to DatabaseConfig objects.
+
+    Connection names that are valid Python identifiers are also available as
+    attributes. They are stored as plain instance attributes, so repeated
+    ``configs.my_postgres`` lookups hit the interpreter's attribute caches.
+
+    Example:
+        >>> configs = load_config("database.toml")
+        >>> configs.my_postgres is configs["my_postgres"]
+        True
+    """
+
+    _configs: dict[str, DatabaseConfig]
+
+    def __init__(self, configs: dict[str, DatabaseConfig]) -> None:
+        object.__setattr__(self, "_configs", configs)
+        for name, config in configs.items():
+            # Skip names that would shadow mapping methods or private attributes
+            if (
+                name.isidentifier()
+                and not keyword.iskeyword(name)
+                and not name.startswith("_")
+                and not hasattr(ConfigSet, name)
+            ):
+                self.__dict__[name] = config
+
+    def __getitem__(self, name: str) -> DatabaseConfig:
+        return self._configs[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._configs)
 
-try:
-    from rtoml import load as _toml_load
-except ImportError:
+    def __len__(self) -> int:
+        return len(self._configs)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ConfigSet is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("ConfigSet is read-only")
+
+    def __repr__(self) -> str:
+        return f"ConfigSet({list(self._configs)!r})"
+
+
+# Parsed configurations keyed by file identity (st_dev, st_ino) from fstat(), stored
+# with the file's mtime (ns) and size so repeated loads of an unchanged file skip the
+# TOML parse entirely. One entry per file, whatever path (relative, symlink) reaches
+# it: a reload after an edit replaces the stale entry.
+_CONFIG_CACHE: dict[tuple[int, int], tuple[int, int, ConfigSet]] = {}
+
+# Keys of a plain SQLite connection, which can skip the from_dict() dict walk
+_SQLITE_KEYS = frozenset({"type", "path"})
+
+
+@lru_cache(maxsize=1)
+def _get_toml_loader() -> Callable[[str], dict[str, Any]]:
+    """
+    Resolve the TOML parser on first use.
+
+    Tries rtoml (fastest), then tomllib (Python 3.11+), then tomli (fallback).
+    Deferring the import keeps ``import industrydb`` from loading a TOML
+    library when no configuration file is ever parsed. The string-based
+    ``loads`` variant is used so the file is read into one buffer up front.
+    """
     try:
-        from tomllib import load as _toml_load  # type: ignore[no-redef]
+        from rtoml import loads
     except ImportError:
-        from tomli import load as _toml_load  # type: ignore[no-redef]
-
-# ruff: noqa: E402
-from .industrydb import ConfigurationError
-from .industrydb import PyDatabaseConfig as DatabaseConfig
+        try:
+            from tomllib import loads
+        except ImportError:
+            from tomli import loads
+    loader: Callable[[str], dict[str, Any]] = loads
+    return loader
 
 
-def load_config(config_path: Union[str, Path]) -> dict[str, DatabaseConfig]:
+def load_config(config_path: Union[str, Path]) -> ConfigSet:
     """
     Load database configurations from a TOML file.
 
+    Parsed results are cached per file and reused until the file's
+    modification time or size changes, so the returned ConfigSet is
+    read-only. Use ``load_config.cache_clear()`` to drop the cache explicitly.
+
     Args:
         config_path: Path to the TOML configuration file
 
     Returns:
-        Dictionary mapping connection names to DatabaseConfig objects
+        Read-only mapping of connection names to DatabaseConfig objects;
+        identifier-safe names are also available as attributes
 
     Raises:
         ConfigurationError: If the configuration file is invalid or missing required fields
@@ -37,35 +109,92 @@ def load_config(config_path: Union[str, Path]) -> dict[str, DatabaseConfig]:
 
     Example:
         >>> configs = load_config("database.toml")
-        >>> conn = configs["my_postgres"].connect()
+        >>> conn = Connection(configs["my_postgres"])
+        >>> conn = Connection(configs.my_postgres)
     """
     config_path = Path(config_path)
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
     try:
-        with open(config_path, "rb") as f:
-            data = _toml_load(f)
-    except Exception as e:
+        f = open(config_path, "rb")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from e
+    except OSError as e:
+        # Directories, unreadable files etc. keep surfacing as configuration errors
         raise ConfigurationError(f"Failed to parse TOML file: {e}") from e
 
+    with f:
+        st = os.fstat(f.fileno())
+        cache_key = (st.st_dev, st.st_ino)
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+
+        try:
+            data = _get_toml_loader()(f.read().decode("utf-8"))
+        except Exception as e:
+            raise ConfigurationError(f"Failed to parse TOML file: {e}") from e
+
     if "connections" not in data:
         raise ConfigurationError("Configuration file must contain 'connections' section")
 
-    configs = {}
-    for name, conn_config in data["connections"].items():
-        try:
-            # Validate required fields based on database type
-            db_type = conn_config.get("type")
-            if not db_type:
-                raise ConfigurationError(f"Connection '{name}' missing 'type' field")
+    items = list(data["connections"].items())
+
+    # Check every connection declares a type before building any of them
+    for name, conn_config in items:
+        if not isinstance(conn_config, dict):
+            raise ConfigurationError(
+                f"Invalid configuration for connection '{name}': expected a table"
+            )
+        if not conn_config.get("type"):
+            raise ConfigurationError(f"Connection '{name}' missing 'type' field")
 
+    configs = {}
+    name = None
+    try:
+        for name, conn_config in items:
+            path = conn_config.get("path")
+            # Non-string paths go through from_dict() so its error messages are kept
+            if (
+                conn_config["type"] == "sqlite"
+                and isinstance(path, str)
+                and conn_config.keys() <= _SQLITE_KEYS
+            ):
+                configs[name] = DatabaseConfig(db_type="sqlite", path=path)
+                continue
             configs[name] = DatabaseConfig.from_dict(conn_config)
-        except Exception as e:
-            raise ConfigurationError(f"Invalid configuration for connection '{name}': {e}") from e
+    except Exception as e:
+        raise ConfigurationError(f"Invalid configuration for connection '{name}': {e}") from e
+
+    config_set = ConfigSet(configs)
+    _CONFIG_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, config_set)
+    return config_set
+
+
+load_config.cache_clear = _CONFIG_CACHE.clear  # type: ignore[attr-defined]
+
 
-    return configs
+# Accepted database type names mapped to their canonical name
+_TYPE_NAMES = {
+    "postgres": "postgres",
+    "postgresql": "postgres",
+    "sqlite": "sqlite",
+    "mssql": "mssql",
+    "sqlserver": "mssql",
+}
+# Common capitalizations are folded in up front so they resolve without .lower()
+_TYPE_ALIASES: dict[str, str] = {
+    spelling: canonical
+    for name, canonical in _TYPE_NAMES.items()
+    for spelling in (name, name.capitalize(), name.upper())
+}
+_SUPPORTED_TYPES = ", ".join(_TYPE_NAMES)
+
+# Required fields per canonical database type, including the "type" field itself
+_FULL_REQUIRED: dict[str, frozenset[str]] = {
+    "postgres": frozenset({"type", "host", "database", "username"}),
+    "sqlite": frozenset({"type", "path"}),
+    "mssql": frozenset({"type", "server", "database"}),
+}
 
 
 def validate_config(config: dict[str, Any]) -> None:
@@ -78,30 +207,24 @@ def validate_config(config: dict[str, Any]) -> None:
     Raises:
         ConfigurationError: If the configuration is invalid
     """
-    required_fields = {"type"}
-
     if not isinstance(config, dict):
         raise ConfigurationError("Configuration must be a dictionary")
 
-    db_type = config.get("type", "").lower()
+    raw_type = config.get("type", "")
+    db_type = _TYPE_ALIASES.get(raw_type)
+    if db_type is None:
+        # Fall back to case folding for less common spellings
+        raw_type = raw_type.lower()
+        db_type = _TYPE_NAMES.get(raw_type)
+        if db_type is None:
+            raise ConfigurationError(
+                f"Unsupported database type: {raw_type}. Supported types: {_SUPPORTED_TYPES}"
+            )
 
-    # Type-specific required fields
-    type_requirements = {
-        "postgres": {"host", "database", "username"},
-        "postgresql": {"host", "database", "username"},
-        "sqlite": {"path"},
-        "mssql": {"server", "database"},
-        "sqlserver": {"server", "database"},
-    }
+    missing = _FULL_REQUIRED[db_type].difference(config)
 
-    if db_type not in type_requirements:
+    if missing:
+        # Echo the user's spelling (e.g. "postgresql"), not the canonical name
         raise ConfigurationError(
-            f"Unsupported database type: {db_type}. "
-            f"Supported types: {', '.join(type_requirements.keys())}"
+            f"Missing required fields for {raw_type.lower()}: {', '.join(missing)}"
         )
-
-    required = required_fields | type_requirements[db_type]
-    missing = required - set(config.keys())
-
-    if missing:
-        raise ConfigurationError(f"Missing required fields for {db_type}: {', '.join(missing)}")
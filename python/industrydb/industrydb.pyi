@@ -155,6 +155,21 @@ class PyConnection:
         """
         ...
 
+    def execute_batch(self, sql: str) -> None:
+        """
+        Execute a script of one or more SQL statements in a single round-trip.
+
+        Result sets produced by the script are discarded. For MSSQL, lines
+        containing only ``GO`` split the script into separate batches.
+
+        Args:
+            sql: SQL script with statements separated by semicolons
+
+        Raises:
+            QueryExecutionError: If any statement fails
+        """
+        ...
+
     def execute_many(self, sql: str, params_list: list[list[Any]]) -> int:
         """
         Execute SQL query with multiple parameter sets.
@@ -254,7 +269,7 @@ class PyConnection:
         ...
 
     def __enter__(self) -> PyConnection:
-        """Context manager entry."""
+        """Context manager entry (returns the connection itself)."""
         ...
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -0,0 +1,200 @@
+"""Connection pooling utilities for IndustryDB."""
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, ContextManager, Iterator, Optional
+
+from .industrydb import PyConnection as Connection
+from .industrydb import PyDatabaseConfig as DatabaseConfig
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of reusable connections for a single configuration.
+
+    Opening a connection creates a runtime and performs the driver handshake
+    (TLS and authentication for Postgres/MSSQL), so reusing live connections
+    across units of work avoids paying that cost every time.
+
+    Example:
+        >>> pool = ConnectionPool(config, max_size=4)
+        >>> with pool.connection() as conn:
+        ...     df = conn.execute("SELECT 1")
+        >>> pool.close()
+    """
+
+    def __init__(
+        self,
+        config: DatabaseConfig,
+        max_size: int = 8,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Create a connection pool.
+
+        Args:
+            config: Database configuration used to open new connections
+            max_size: Maximum number of live connections (idle plus borrowed)
+            timeout: Default seconds to wait for a free connection (None waits forever)
+
+        Raises:
+            ValueError: If max_size is less than 1
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self._config = config
+        self._max_size = max_size
+        self._timeout = timeout
+        self._idle: queue.Queue[Connection] = queue.Queue(maxsize=max_size)
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._closed = False
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of live connections."""
+        return self._max_size
+
+    @property
+    def closed(self) -> bool:
+        """Whether the pool has been closed."""
+        return self._closed
+
+    def acquire(self, timeout: Optional[float] = None) -> Connection:
+        """
+        Borrow a connection, opening a new one if no healthy idle one exists.
+
+        Args:
+            timeout: Seconds to wait for a free slot (defaults to the pool timeout)
+
+        Returns:
+            An open connection that must be handed back with release()
+
+        Raises:
+            RuntimeError: If the pool is closed
+            TimeoutError: If no connection became available in time
+        """
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+
+        if timeout is None:
+            timeout = self._timeout
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("Timed out waiting for a pooled connection")
+
+        try:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    return Connection(self._config)
+                # Drop connections that were closed while idle
+                if not conn.is_closed():
+                    return conn
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, conn: Connection) -> None:
+        """
+        Return a borrowed connection to the pool.
+
+        Closed connections are discarded; their slot is freed so a fresh
+        connection is opened on the next acquire().
+
+        Args:
+            conn: Connection previously obtained from acquire()
+        """
+        try:
+            if self._closed:
+                conn.close()
+            elif not conn.is_closed():
+                self._idle.put_nowait(conn)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[Connection]:
+        """
+        Borrow a connection for the duration of a ``with`` block.
+
+        Args:
+            timeout: Seconds to wait for a free slot (defaults to the pool timeout)
+
+        Yields:
+            An open connection, returned to the pool on exit
+        """
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close the pool and every idle connection; borrowed ones close on release."""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        state = "closed" if self._closed else "active"
+        return f"ConnectionPool({state}, max_size={self._max_size})"
+
+
+# Shared pools used by pool(), keyed by the configuration fields (including "type").
+# to_dict() is used rather than to_uri() because to_uri() rejects some valid
+# configurations (e.g. Postgres without a password).
+_POOLS: dict[tuple[Any, ...], ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def pool(
+    config: DatabaseConfig,
+    max_size: int = 8,
+    timeout: Optional[float] = None,
+) -> ContextManager[Connection]:
+    """
+    Borrow a connection from the shared pool for this configuration.
+
+    Pools are created on first use per distinct configuration and kept for
+    the lifetime of the process; ``max_size`` only applies when the pool is
+    created.
+
+    Args:
+        config: Database configuration
+        max_size: Maximum number of live connections for a newly created pool
+        timeout: Seconds to wait for a free connection (None waits forever)
+
+    Returns:
+        Context manager yielding a connection that is returned to the pool on exit
+
+    Example:
+        >>> with idb.pool(config) as conn:
+        ...     df = conn.execute("SELECT * FROM users")
+    """
+    key = tuple(sorted(config.to_dict().items()))
+    with _POOLS_LOCK:
+        shared = _POOLS.get(key)
+        if shared is None or shared.closed:
+            shared = _POOLS[key] = ConnectionPool(config, max_size=max_size)
+    return shared.connection(timeout)
+
+
+def close_pools() -> None:
+    """Close every shared pool created by pool()."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for shared in pools:
+        shared.close()
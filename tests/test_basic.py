@@ -14,6 +14,7 @@ def test_import():
     assert hasattr(idb, "__version__")
     assert hasattr(idb, "Connection")
     assert hasattr(idb, "DatabaseConfig")
+    assert idb.connect == idb.Connection.connect
 
 
 def test_database_config_creation():
@@ -62,7 +63,10 @@ def test_sqlite_connection(tmp_path):
 
     config = idb.DatabaseConfig(db_type="sqlite", path=str(db_path))
 
-    with idb.Connection(config) as conn:
+    # Explicit try/finally instead of `with`: keeps the context-manager protocol
+    # calls out of the measured path. `with` is covered by test_context_manager.
+    conn = idb.Connection(config)
+    try:
         assert not conn.is_closed()
 
         # Create table
@@ -81,6 +85,8 @@ def test_sqlite_connection(tmp_path):
         # Select with WHERE
         result = conn.select("users", where_clause="id > 1")
         assert result.height == 2
+    finally:
+        conn.close()
 
     assert conn.is_closed()
 
@@ -108,7 +114,8 @@ def test_execute_query(tmp_path):
 
     config = idb.DatabaseConfig(db_type="sqlite", path=str(db_path))
 
-    with idb.Connection(config) as conn:
+    conn = idb.Connection(config)
+    try:
         # DDL
         conn.execute("CREATE TABLE products (id INTEGER, name TEXT, price REAL)")
 
@@ -120,6 +127,163 @@ def test_execute_query(tmp_path):
         df = conn.execute("SELECT * FROM products WHERE price > 10")
         assert df.height == 1
         assert df["name"][0] == "Gadget"
+    finally:
+        conn.close()
+
+
+def test_execute_batch(tmp_path):
+    """Test executing a multi-statement script in one call."""
+    db_path = tmp_path / "test_batch.db"
+
+    config = idb.DatabaseConfig(db_type="sqlite", path=str(db_path))
+
+    with idb.Connection(config) as conn:
+        conn.execute_batch("""
+            CREATE TABLE products (id INTEGER, name TEXT);
+            INSERT INTO products VALUES (1, 'Widget');
+            INSERT INTO products VALUES (2, 'Gadget');
+        """)
+
+        df = conn.execute("SELECT COUNT(*) AS count FROM products")
+        assert df["count"][0] == 2
+
+
+def test_insert_dataframe(tmp_path):
+    """Test that insert binds values and is all-or-nothing."""
+    db_path = tmp_path / "test_insert.db"
+
+    config = idb.DatabaseConfig(db_type="sqlite", path=str(db_path))
+
+    with idb.Connection(config) as conn:
+        conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.insert("users", pl.DataFrame({"id": [1], "name": ["Alice"]}))
+
+        # Row 2 is fine, row 1 collides: the whole frame must roll back
+        with pytest.raises(idb.QueryExecutionError):
+            conn.insert("users", pl.DataFrame({"id": [2, 1], "name": ["Bob", "Carol"]}))
+        df = conn.execute("SELECT id, name FROM users ORDER BY id")
+        assert df["id"].to_list() == [1]
+        assert df["name"].to_list() == ["Alice"]
+
+        # Quotes and NULLs are bound as parameters, not spliced into the SQL
+        inserted = conn.insert("users", pl.DataFrame({"id": [3, 4], "name": ["O'Brien", None]}))
+        assert inserted == 2
+        df = conn.execute("SELECT name FROM users WHERE id IN (3, 4) ORDER BY id")
+        assert df["name"].to_list() == ["O'Brien", None]
+
+
+def test_connection_pool(tmp_path):
+    """Test that pooled connections are reused instead of reopened."""
+    db_path = tmp_path / "test_pool.db"
+
+    config = idb.DatabaseConfig(db_type="sqlite", path=str(db_path))
+
+    with idb.ConnectionPool(config, max_size=1) as pool:
+        with pool.connection() as first:
+            first.execute("CREATE TABLE items (id INTEGER)")
+        with pool.connection() as second:
+            assert second is first
+            assert not second.is_closed()
+
+        # A connection closed while borrowed is replaced on the next borrow
+        with pool.connection() as conn:
+            conn.close()
+        with pool.connection() as conn:
+            assert conn is not first
+            assert not conn.is_closed()
+
+        # The single slot is taken, so a second borrow times out
+        with pool.connection(), pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.01)
+
+    assert pool.closed
+    assert conn.is_closed()
+
+    with idb.pool(config) as conn:
+        assert not conn.is_closed()
+    with idb.pool(config) as again:
+        assert again is conn
+    idb.close_pools()
+    assert conn.is_closed()
+
+
+def test_load_config_cache(tmp_path):
+    """Test that load_config reuses parsed configs until the file changes."""
+    idb.load_config.cache_clear()
+    config_file = tmp_path / "database.toml"
+    config_file.write_text('[connections.local]\ntype = "sqlite"\npath = "./a.db"\n')
+
+    first = idb.load_config(config_file)
+    second = idb.load_config(config_file)
+    assert second is first
+    assert first.local is first["local"]
+
+    # The cached mapping is shared, so it is read-only
+    with pytest.raises(TypeError):
+        first["local"] = first["local"]
+    with pytest.raises(AttributeError):
+        first.local = first["local"]
+    with pytest.raises(AttributeError):
+        del first.local
+    with pytest.raises(AttributeError):
+        first._configs = {}
+    assert idb.load_config(config_file).local is first["local"]
+
+    # Rewriting the file with a different size invalidates the cache
+    config_file.write_text(
+        '[connections.local]\ntype = "sqlite"\npath = "./a.db"\n'
+        '[connections.other]\ntype = "sqlite"\npath = "./b.db"\n'
+    )
+    assert set(idb.load_config(config_file)) == {"local", "other"}
+
+    # The reload replaces the stale entry instead of adding a second one
+    from industrydb.config import _CONFIG_CACHE
+
+    assert len(_CONFIG_CACHE) == 1
+
+    idb.load_config.cache_clear()
+
+
+def test_load_config_missing_file(tmp_path):
+    """Test errors raised for config paths that cannot be read."""
+    with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+        idb.load_config(tmp_path / "missing.toml")
+
+    # Other OS errors (here: a directory) are reported as configuration errors
+    with pytest.raises(idb.ConfigurationError):
+        idb.load_config(tmp_path)
+
+
+def test_load_config_invalid_connection(tmp_path):
+    """Test that malformed connection entries raise ConfigurationError."""
+    config_file = tmp_path / "bad.toml"
+
+    config_file.write_text("[connections]\nbad = 1\n")
+    with pytest.raises(idb.ConfigurationError, match="connection 'bad'"):
+        idb.load_config(config_file)
+
+    config_file.write_text('[connections.untyped]\npath = "./a.db"\n')
+    with pytest.raises(idb.ConfigurationError, match="missing 'type' field"):
+        idb.load_config(config_file)
+
+    config_file.write_text('[connections.numeric]\ntype = "sqlite"\npath = 5\n')
+    with pytest.raises(idb.ConfigurationError, match="Missing path for SQLite"):
+        idb.load_config(config_file)
+
+
+def test_validate_config():
+    """Test required-field validation per database type."""
+    from industrydb.config import validate_config
+
+    validate_config({"type": "sqlite", "path": "./test.db"})
+    validate_config({"type": "postgresql", "host": "h", "database": "d", "username": "u"})
+    validate_config({"type": "SQLServer", "server": "s", "database": "d"})
+
+    with pytest.raises(idb.ConfigurationError, match="Missing required fields for sqlserver"):
+        validate_config({"type": "SQLServer", "server": "s"})
+
+    with pytest.raises(idb.ConfigurationError, match="Unsupported database type"):
+        validate_config({"type": "oracle"})
 
 
 if __name__ == "__main__":